@@ -4,8 +4,32 @@ SPDX-License-Identifier: MIT-0
 '''
 
 import aws_cdk as cdk
-from stacks.apigw_http_api_lambda_dynamodb_python_cdk_stack import ApigwHttpApiLambdaDynamodbPythonCdkStack
+from stacks.data_stack import DataStack
+from stacks.network_stack import NetworkStack
+from stacks.api_stack import ApiStack
+from stacks.observability_stack import ObservabilityStack
 
 app = cdk.App()
-ApigwHttpApiLambdaDynamodbPythonCdkStack(app, "ApigwHttpApiLambdaDynamodbPythonCdkStack")
+data_stack = DataStack(app, "ApigwHttpApiLambdaDynamodbDataStack")
+network_stack = NetworkStack(
+    app,
+    "ApigwHttpApiLambdaDynamodbNetworkStack",
+    table=data_stack.table,
+    single_az_endpoints=str(app.node.try_get_context("single_az_endpoints")).lower() == "true",
+)
+api_stack = ApiStack(
+    app,
+    "ApigwHttpApiLambdaDynamodbApiStack",
+    vpc=network_stack.vpc,
+    table=data_stack.table,
+    memory_size=int(app.node.try_get_context("memory_size") or 1024),
+)
+ObservabilityStack(
+    app,
+    "ApigwHttpApiLambdaDynamodbObservabilityStack",
+    vpc=network_stack.vpc,
+    api=api_stack.api,
+    api_alarms=api_stack.alarms,
+    flow_logs=str(app.node.try_get_context("flow_logs")).lower() != "false",
+)
 app.synth()
@@ -0,0 +1,34 @@
+// Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+// SPDX-License-Identifier: MIT-0
+
+const https = require('https');
+const synthetics = require('Synthetics');
+const log = require('SyntheticsLogger');
+
+exports.handler = async () => {
+    // Plain HTTP check, no browser steps or screenshots needed
+    synthetics.getConfiguration().setConfig({
+        screenshotOnStepStart: false,
+        screenshotOnStepSuccess: false,
+        screenshotOnStepFailure: false
+    });
+
+    const url = process.env.API_URL;
+    log.info('Starting canary test');
+
+    // Fail fast instead of waiting for the canary timeout if the API hangs
+    await new Promise((resolve, reject) => {
+        const req = https.get(url, { timeout: 30000 }, (res) => {
+            res.resume();
+            log.info(`Response status: ${res.statusCode}`);
+            res.statusCode < 400 ? resolve() : reject(new Error(`Failed with status ${res.statusCode}`));
+        });
+        req.on('timeout', () => {
+            req.destroy();
+            reject(new Error('Request timed out after 30 seconds'));
+        });
+        req.on('error', reject);
+    });
+
+    log.info('Canary test completed successfully');
+};
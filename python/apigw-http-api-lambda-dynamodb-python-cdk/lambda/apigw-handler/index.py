@@ -10,7 +10,9 @@ import uuid
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Created once per execution environment and reused across warm invokes
 dynamodb_client = boto3.client("dynamodb")
+table = os.environ.get("TABLE_NAME")
 
 
 def handler(event, context):
@@ -29,7 +31,6 @@ def handler(event, context):
         'path': path,
     }))
     
-    table = os.environ.get("TABLE_NAME")
     logger.info(json.dumps({
         'event': 'table_loaded',
         'request_id': request_id,
@@ -0,0 +1,159 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+from aws_cdk import (
+    BundlingOptions,
+    CfnOutput,
+    Stack,
+    aws_dynamodb as dynamodb_,
+    aws_lambda as lambda_,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
+    aws_ec2 as ec2,
+    aws_logs as logs,
+    aws_cloudwatch as cloudwatch,
+    Duration,
+    RemovalPolicy,
+)
+from constructs import Construct
+
+
+class ApiStack(Stack):
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        vpc: ec2.IVpc,
+        table: dynamodb_.ITable,
+        memory_size: int = 1024,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        # Create the Lambda function to receive the request with X-Ray tracing
+        api_hanlder = lambda_.Function(
+            self,
+            "ApiHandler",
+            function_name="apigw_handler",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            # The handler only needs boto3, which the runtime provides, so the
+            # asset is just the source, precompiled so cold starts skip the
+            # bytecode compile. Unchecked-hash pycs stay valid even though the
+            # asset zip resets source timestamps
+            code=lambda_.Code.from_asset(
+                "lambda/apigw-handler",
+                exclude=["**/__pycache__", "*.pyc"],
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
+                    command=[
+                        "bash", "-c",
+                        "cp -r /asset-input/. /asset-output && "
+                        "python -m compileall -q --invalidation-mode unchecked-hash /asset-output",
+                    ],
+                ),
+            ),
+            handler="index.handler",
+            # Kept in isolated subnets: DynamoDB and X-Ray are reached through
+            # the VPC endpoints in the network stack, so no NAT is needed. The
+            # provisioned concurrency alias below absorbs the VPC init cost
+            vpc=vpc,
+            vpc_subnets=ec2.SubnetSelection(
+                subnet_type=ec2.SubnetType.PRIVATE_ISOLATED
+            ),
+            memory_size=memory_size,
+            timeout=Duration.minutes(5),
+            log_group=self._log_group("ApiHandlerLogs"),
+            tracing=lambda_.Tracing.ACTIVE,
+        )
+
+        # grant permission to lambda to write to demo table
+        table.grant_write_data(api_hanlder)
+        api_hanlder.add_environment("TABLE_NAME", table.table_name)
+
+        # Publish a version behind a "live" alias with provisioned concurrency
+        # so requests hit pre-initialized execution environments
+        api_alias = lambda_.Alias(
+            self,
+            "ApiHandlerAlias",
+            alias_name="live",
+            version=api_hanlder.current_version,
+            provisioned_concurrent_executions=2,
+        )
+
+        # Scale provisioned concurrency with utilization under load
+        api_alias.add_auto_scaling(
+            min_capacity=2, max_capacity=10
+        ).scale_on_utilization(utilization_target=0.7)
+
+        # Create log group for API Gateway access logs
+        api_log_group = self._log_group("ApiGatewayAccessLogs")
+
+        # Create HTTP API with the Lambda alias as default integration. Payload
+        # format 1.0 keeps the REST-style event shape the handler expects
+        self.api = apigwv2.HttpApi(
+            self,
+            "Endpoint",
+            default_integration=apigwv2_integrations.HttpLambdaIntegration(
+                "ApiHandlerIntegration",
+                api_alias,
+                payload_format_version=apigwv2.PayloadFormatVersion.VERSION_1_0,
+            ),
+        )
+
+        # Enable access logging on the default stage
+        default_stage = self.api.default_stage.node.default_child
+        default_stage.access_log_settings = apigwv2.CfnStage.AccessLogSettingsProperty(
+            destination_arn=api_log_group.log_group_arn,
+            format=json.dumps({
+                "requestId": "$context.requestId",
+                "ip": "$context.identity.sourceIp",
+                "caller": "$context.identity.caller",
+                "user": "$context.identity.user",
+                "requestTime": "$context.requestTime",
+                "httpMethod": "$context.httpMethod",
+                "resourcePath": "$context.routeKey",
+                "status": "$context.status",
+                "protocol": "$context.protocol",
+                "responseLength": "$context.responseLength",
+            }),
+        )
+
+        # Output the API endpoint URL
+        CfnOutput(self, "ApiUrl", value=self.api.url)
+
+        # CloudWatch Alarms for Lambda and API Gateway errors. Missing data is
+        # not breaching so quiet periods do not raise alarms
+        alarm_specs = [
+            ("LambdaErrorAlarm",
+             api_hanlder.metric_errors(period=Duration.minutes(5), statistic="Sum"),
+             1, 1, "Alert when Lambda function errors occur"),
+            ("ApiGateway5xxAlarm",
+             self.api.metric_server_error(period=Duration.minutes(5), statistic="Sum"),
+             5, 2, "Alert when API Gateway 5xx errors occur"),
+            ("ApiGateway4xxAlarm",
+             self.api.metric_client_error(period=Duration.minutes(5), statistic="Sum"),
+             10, 2, "Alert when API Gateway 4xx errors exceed threshold"),
+        ]
+        self.alarms = {}
+        for alarm_id, metric, threshold, evaluation_periods, description in alarm_specs:
+            self.alarms[alarm_id] = cloudwatch.Alarm(
+                self,
+                alarm_id,
+                metric=metric,
+                threshold=threshold,
+                evaluation_periods=evaluation_periods,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+                alarm_description=description,
+            )
+
+    def _log_group(self, construct_id: str) -> logs.LogGroup:
+        # Explicit log group with the retention and removal shared by the stack,
+        # avoids the LogRetention custom resource that log_retention creates
+        return logs.LogGroup(
+            self,
+            construct_id,
+            retention=logs.RetentionDays.ONE_YEAR,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
@@ -0,0 +1,26 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from aws_cdk import (
+    Stack,
+    aws_dynamodb as dynamodb_,
+)
+from constructs import Construct
+
+TABLE_NAME = "demo_table"
+
+
+class DataStack(Stack):
+    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        # Create on-demand DynamoDb Table with Point-in-Time Recovery
+        self.table = dynamodb_.Table(
+            self,
+            TABLE_NAME,
+            partition_key=dynamodb_.Attribute(
+                name="id", type=dynamodb_.AttributeType.STRING
+            ),
+            billing_mode=dynamodb_.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery=True,
+        )
@@ -0,0 +1,90 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from aws_cdk import (
+    Stack,
+    aws_dynamodb as dynamodb_,
+    aws_ec2 as ec2,
+    aws_iam as iam,
+)
+from constructs import Construct
+
+
+class NetworkStack(Stack):
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        table: dynamodb_.ITable,
+        single_az_endpoints: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        # VPC
+        self.vpc = ec2.Vpc(
+            self,
+            "Ingress",
+            cidr="10.1.0.0/16",
+            subnet_configuration=[
+                ec2.SubnetConfiguration(
+                    name="Private-Subnet", subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
+                    cidr_mask=24
+                )
+            ],
+        )
+
+        # Create VPC endpoint for DynamoDB
+        dynamo_db_endpoint = ec2.GatewayVpcEndpoint(
+            self,
+            "DynamoDBVpce",
+            service=ec2.GatewayVpcEndpointAwsService.DYNAMODB,
+            vpc=self.vpc,
+        )
+
+        # Restrict the endpoint to the PutItem calls the handler makes
+        dynamo_db_endpoint.add_to_policy(
+            iam.PolicyStatement(
+                principals=[iam.AnyPrincipal()],
+                actions=["dynamodb:PutItem"],
+                resources=[table.table_arn],
+                conditions={"StringEquals": {"aws:PrincipalAccount": self.account}},
+            )
+        )
+
+        # Security group shared by all interface endpoints, allowing HTTPS from
+        # the VPC only
+        self.endpoint_security_group = ec2.SecurityGroup(
+            self,
+            "InterfaceEndpointSecurityGroup",
+            vpc=self.vpc,
+            description="Shared security group for interface VPC endpoints",
+            allow_all_outbound=False,
+        )
+        self.endpoint_security_group.add_ingress_rule(
+            ec2.Peer.ipv4(self.vpc.vpc_cidr_block),
+            ec2.Port.tcp(443),
+            "HTTPS from within the VPC",
+        )
+
+        # Interface endpoints are billed per AZ, development deployments can
+        # place them in a single subnet and reach them across AZs
+        if single_az_endpoints:
+            endpoint_subnets = ec2.SubnetSelection(
+                subnets=[self.vpc.isolated_subnets[0]]
+            )
+        else:
+            endpoint_subnets = ec2.SubnetSelection(
+                subnet_type=ec2.SubnetType.PRIVATE_ISOLATED
+            )
+
+        # Create VPC endpoint for X-Ray (required for Lambda in isolated subnets)
+        ec2.InterfaceVpcEndpoint(
+            self,
+            "XRayVpce",
+            vpc=self.vpc,
+            service=ec2.InterfaceVpcEndpointAwsService.XRAY,
+            subnets=endpoint_subnets,
+            open=False,
+            security_groups=[self.endpoint_security_group],
+        )
@@ -0,0 +1,113 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from typing import Mapping
+
+from aws_cdk import (
+    Stack,
+    aws_apigatewayv2 as apigwv2,
+    aws_ec2 as ec2,
+    aws_cloudtrail as cloudtrail,
+    aws_s3 as s3,
+    aws_cloudwatch as cloudwatch,
+    aws_synthetics as synthetics,
+    Duration,
+    RemovalPolicy,
+)
+from constructs import Construct
+
+
+class ObservabilityStack(Stack):
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        vpc: ec2.IVpc,
+        api: apigwv2.HttpApi,
+        api_alarms: Mapping[str, cloudwatch.IAlarm],
+        flow_logs: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        # Create S3 bucket for CloudTrail and VPC Flow Logs
+        trail_bucket = s3.Bucket(
+            self,
+            "CloudTrailBucket",
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(7))],
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # Enable VPC Flow Logs for rejected traffic, delivered to S3
+        if flow_logs:
+            ec2.FlowLog(
+                self,
+                "FlowLog",
+                resource_type=ec2.FlowLogResourceType.from_vpc(vpc),
+                destination=ec2.FlowLogDestination.to_s3(
+                    trail_bucket, key_prefix="vpc-flow/"
+                ),
+                traffic_type=ec2.FlowLogTrafficType.REJECT,
+            )
+
+        # S3 bucket for Canary artifacts
+        canary_bucket = s3.Bucket(
+            self,
+            "CanaryArtifactsBucket",
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(7))],
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # CloudWatch Synthetic Canary to monitor API endpoint
+        canary = synthetics.Canary(
+            self,
+            "ApiCanary",
+            runtime=synthetics.Runtime.SYNTHETICS_NODEJS_PUPPETEER_11_0,
+            test=synthetics.Test.custom(
+                code=synthetics.Code.from_asset("canary"),
+                handler="index.handler",
+            ),
+            artifacts_bucket_location=synthetics.ArtifactsBucketLocation(
+                bucket=canary_bucket
+            ),
+            schedule=synthetics.Schedule.rate(Duration.minutes(5)),
+            start_after_creation=True,
+            environment_variables={"API_URL": api.url},
+        )
+
+        # CloudWatch Alarm for Canary failures
+        canary_alarm = cloudwatch.Alarm(
+            self,
+            "CanaryFailureAlarm",
+            metric=canary.metric_failed(),
+            threshold=1,
+            evaluation_periods=1,
+            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            alarm_description="Alert when synthetic canary fails",
+        )
+
+        # Single signal for API health instead of one notification per alarm
+        cloudwatch.CompositeAlarm(
+            self,
+            "ApiHealthAlarm",
+            alarm_rule=cloudwatch.AlarmRule.any_of(
+                api_alarms["LambdaErrorAlarm"],
+                api_alarms["ApiGateway5xxAlarm"],
+                canary_alarm,
+            ),
+            alarm_description="Alert when the API is unhealthy",
+        )
+
+        # Create single-region CloudTrail for write management events
+        cloudtrail.Trail(
+            self,
+            "CloudTrail",
+            bucket=trail_bucket,
+            is_multi_region_trail=False,
+            include_global_service_events=False,
+            management_events=cloudtrail.ReadWriteType.WRITE_ONLY,
+        )
@@ -1,11 +1,183 @@
 import aws_cdk as core
 import aws_cdk.assertions as assertions
 
-from stacks.apigw_http_api_lambda_dynamodb_python_cdk_stack import ApigwHttpApiLambdaDynamodbPythonCdkStack
+from stacks.data_stack import DataStack
+from stacks.network_stack import NetworkStack
+from stacks.api_stack import ApiStack
+from stacks.observability_stack import ObservabilityStack
+
+
+def synth_templates(memory_size=1024, flow_logs=True, single_az_endpoints=False):
+    # Skip Docker asset bundling, the templates do not depend on it
+    app = core.App(context={"aws:cdk:bundling-stacks": []})
+    data_stack = DataStack(app, "data")
+    network_stack = NetworkStack(app, "network", table=data_stack.table, single_az_endpoints=single_az_endpoints)
+    api_stack = ApiStack(app, "api", vpc=network_stack.vpc, table=data_stack.table, memory_size=memory_size)
+    observability_stack = ObservabilityStack(
+        app,
+        "observability",
+        vpc=network_stack.vpc,
+        api=api_stack.api,
+        api_alarms=api_stack.alarms,
+        flow_logs=flow_logs,
+    )
+    return {
+        "data": assertions.Template.from_stack(data_stack),
+        "network": assertions.Template.from_stack(network_stack),
+        "api": assertions.Template.from_stack(api_stack),
+        "observability": assertions.Template.from_stack(observability_stack),
+    }
 
 
 def test_sqs_queue_created():
-    app = core.App()
-    stack = ApigwHttpApiLambdaDynamodbPythonCdkStack(app, "apigw-http-api-lambda-dynamodb-python-cdk")
-    template = assertions.Template.from_stack(stack)
+    synth_templates()
+
+
+def test_api_handler_alias_has_provisioned_concurrency():
+    template = synth_templates()["api"]
+
+    template.has_resource_properties("AWS::Lambda::Alias", {
+        "Name": "live",
+        "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 2},
+    })
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalableTarget", {
+        "MinCapacity": 2,
+        "MaxCapacity": 10,
+    })
+
+
+def test_canary_uses_nodejs_runtime():
+    template = synth_templates()["observability"]
+
+    template.has_resource_properties("AWS::Synthetics::Canary", {
+        "RuntimeVersion": "syn-nodejs-puppeteer-11.0",
+        "Code": {"Handler": "index.handler"},
+        "StartCanaryAfterCreation": True,
+        "RunConfig": {"EnvironmentVariables": {"API_URL": assertions.Match.any_value()}},
+    })
+
+
+def test_log_groups_share_retention_without_custom_resource():
+    template = synth_templates()["api"]
+
+    template.resource_count_is("Custom::LogRetention", 0)
+    template.resource_properties_count_is("AWS::Logs::LogGroup", {"RetentionInDays": 365}, 2)
+
+
+def test_http_api_logs_to_access_log_group():
+    template = synth_templates()["api"]
+
+    template.has_resource_properties("AWS::ApiGatewayV2::Api", {"ProtocolType": "HTTP"})
+    template.has_resource_properties("AWS::ApiGatewayV2::Integration", {"PayloadFormatVersion": "1.0"})
+    template.has_resource_properties("AWS::ApiGatewayV2::Stage", {
+        "AccessLogSettings": {"DestinationArn": assertions.Match.any_value()},
+    })
+
+
+def test_api_handler_runs_python_3_12_on_arm64():
+    template = synth_templates()["api"]
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "FunctionName": "apigw_handler",
+        "Runtime": "python3.12",
+        "Architectures": ["arm64"],
+    })
+
+
+def test_api_handler_memory_size_is_configurable():
+    template = synth_templates(memory_size=512)["api"]
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "FunctionName": "apigw_handler",
+        "MemorySize": 512,
+    })
+
+
+def test_dynamodb_endpoint_only_allows_put_item_on_table():
+    template = synth_templates()["network"]
+
+    template.has_resource_properties("AWS::EC2::VPCEndpoint", {
+        "PolicyDocument": {
+            "Statement": [assertions.Match.object_like({
+                "Action": "dynamodb:PutItem",
+                "Resource": {"Fn::ImportValue": assertions.Match.string_like_regexp("demotable")},
+            })],
+        },
+    })
+
+
+def test_buckets_expire_objects_without_auto_delete():
+    template = synth_templates()["observability"]
+
+    template.resource_count_is("Custom::S3AutoDeleteObjects", 0)
+    template.resource_properties_count_is("AWS::S3::Bucket", {
+        "LifecycleConfiguration": {
+            "Rules": [{"ExpirationInDays": 7, "Status": "Enabled"}],
+        },
+    }, 2)
+
+
+def test_flow_logs_deliver_rejected_traffic_to_s3():
+    template = synth_templates()["observability"]
+
+    template.has_resource_properties("AWS::EC2::FlowLog", {
+        "LogDestinationType": "s3",
+        "TrafficType": "REJECT",
+    })
+
+
+def test_flow_logs_can_be_disabled():
+    template = synth_templates(flow_logs=False)["observability"]
+
+    template.resource_count_is("AWS::EC2::FlowLog", 0)
+
+
+def test_alarms_treat_missing_data_as_not_breaching():
+    templates = synth_templates()
+
+    templates["api"].resource_properties_count_is("AWS::CloudWatch::Alarm", {"TreatMissingData": "notBreaching"}, 3)
+    templates["observability"].resource_properties_count_is("AWS::CloudWatch::Alarm", {"TreatMissingData": "notBreaching"}, 1)
+
+
+def test_api_health_composite_alarm():
+    templates = synth_templates()
+
+    templates["observability"].resource_count_is("AWS::CloudWatch::CompositeAlarm", 1)
+    templates["api"].has_resource_properties("AWS::CloudWatch::Alarm", {
+        "MetricName": "Errors",
+        "Namespace": "AWS/Lambda",
+        "Statistic": "Sum",
+        "Period": 300,
+    })
+
+
+def test_cloudtrail_is_single_region_write_only():
+    template = synth_templates()["observability"]
+
+    template.has_resource_properties("AWS::CloudTrail::Trail", {
+        "IsMultiRegionTrail": False,
+        "IncludeGlobalServiceEvents": False,
+        "EventSelectors": [{"IncludeManagementEvents": True, "ReadWriteType": "WriteOnly"}],
+    })
+
+
+def test_xray_endpoint_uses_shared_security_group():
+    template = synth_templates()["network"]
+
+    template.has_resource_properties("AWS::EC2::SecurityGroup", {
+        "GroupDescription": "Shared security group for interface VPC endpoints",
+        "SecurityGroupIngress": [assertions.Match.object_like({"FromPort": 443, "ToPort": 443})],
+    })
+    template.has_resource_properties("AWS::EC2::VPCEndpoint", {
+        "VpcEndpointType": "Interface",
+        "SecurityGroupIds": [{"Fn::GetAtt": [assertions.Match.string_like_regexp("InterfaceEndpointSecurityGroup"), "GroupId"]}],
+    })
+
+
+def test_xray_endpoint_can_use_single_subnet():
+    template = synth_templates(single_az_endpoints=True)["network"]
 
+    template.has_resource_properties("AWS::EC2::VPCEndpoint", {
+        "VpcEndpointType": "Interface",
+        "SubnetIds": [assertions.Match.any_value()],
+    })